@@ -3,6 +3,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from config import settings
 import secrets
 import hashlib
+import hmac
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,14 +15,28 @@ class AuthService:
     def __init__(self):
         self.api_key = settings.api_key
         self.require_auth = settings.require_auth
-        
+        # Precompute the encoded key once so verification doesn't
+        # re-encode the stored key on every request
+        self._api_key_bytes = self.api_key.encode()
+        # If the stored key is a SHA256 hex digest, decode it once so the
+        # per-request comparison works on 32 raw bytes instead of 64 hex chars
+        self._stored_is_hash = len(self.api_key) == 64
+        self._api_key_digest: bytes = b""
+        if self._stored_is_hash:
+            try:
+                self._api_key_digest = bytes.fromhex(self.api_key)
+            except ValueError:
+                self._stored_is_hash = False
+
     def generate_api_key(self) -> str:
         """Generate a secure API key"""
         return secrets.token_urlsafe(32)
-    
+
     def hash_api_key(self, api_key: str) -> str:
         """Hash an API key for secure storage"""
-        return hashlib.sha256(api_key.encode()).hexdigest()
+        # usedforsecurity=False skips FIPS wrappers and lets hashlib pick
+        # the fastest OpenSSL SHA-256 implementation (SHA-NI where available)
+        return hashlib.sha256(api_key.encode(), usedforsecurity=False).hexdigest()
     
     def verify_api_key(self, provided_key: str) -> bool:
         """Verify if the provided API key is valid"""
@@ -32,65 +47,88 @@ class AuthService:
             logger.warning("API_KEY not configured but authentication is required")
             return False
             
-        # Support both direct comparison and hashed comparison
-        if provided_key == self.api_key:
+        # Support both direct comparison and hashed comparison.
+        # Use constant-time comparison on bytes so the check doesn't
+        # short-circuit on the first differing byte (timing side channel).
+        provided_bytes = provided_key.encode()
+        stored_bytes = self._api_key_bytes
+        if hmac.compare_digest(provided_bytes, stored_bytes):
             return True
-            
-        # Check if stored key is hashed and compare hashes
-        if len(self.api_key) == 64:  # SHA256 hash length
-            return self.hash_api_key(provided_key) == self.api_key
-            
+
+        # Check if stored key is hashed and compare raw digests
+        if self._stored_is_hash:
+            provided_digest = hashlib.sha256(
+                provided_bytes, usedforsecurity=False
+            ).digest()
+            return hmac.compare_digest(provided_digest, self._api_key_digest)
+
         return False
 
 # Global auth service
 auth_service = AuthService()
 
-async def verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> str:
-    """
-    Verify the API token from Authorization header
-    
-    Args:
-        credentials: HTTP Authorization credentials
-        
-    Returns:
-        The verified token
-        
-    Raises:
-        HTTPException: If token is invalid or missing
-    """
-    if not settings.require_auth:
+# The auth requirement is fixed at startup, so pick the dependency
+# implementation once at import time. When auth is disabled, the no-op
+# variants take no Security parameter at all - FastAPI then never wires
+# HTTPBearer into the dependency graph, skipping the per-request header
+# parse and credentials allocation.
+if settings.require_auth:
+    async def verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> str:
+        """
+        Verify the API token from Authorization header
+
+        Args:
+            credentials: HTTP Authorization credentials
+
+        Returns:
+            The verified token
+
+        Raises:
+            HTTPException: If token is invalid or missing
+        """
+        if not credentials:
+            raise HTTPException(
+                status_code=401,
+                detail="Authorization header is required",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        token = credentials.credentials
+
+        # Slice the preview before the verdict and log via lazy %-format,
+        # so the work done here doesn't differ between the success and
+        # failure paths (keeps the auth path timing uniform)
+        token_preview = token[:8]
+        valid = auth_service.verify_api_key(token)
+
+        if not valid:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Invalid API key attempt: %s...", token_preview)
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid API key",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        return token
+
+    async def optional_verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> str:
+        """
+        Optional token verification - allows access without token in development
+        """
+        try:
+            return await verify_token(credentials)
+        except HTTPException:
+            if settings.environment == "development":
+                logger.info("Development mode: allowing access without token")
+                return "development-access"
+            raise
+else:
+    async def verify_token() -> str:
+        """Auth disabled - accept every request without touching headers"""
         return "no-auth-required"
-        
-    if not credentials:
-        raise HTTPException(
-            status_code=401,
-            detail="Authorization header is required",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    token = credentials.credentials
-    
-    if not auth_service.verify_api_key(token):
-        logger.warning(f"Invalid API key attempt: {token[:8]}...")
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid API key",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    return token
-
-async def optional_verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> str:
-    """
-    Optional token verification - allows access without token in development
-    """
-    try:
-        return await verify_token(credentials)
-    except HTTPException:
-        if settings.environment == "development":
-            logger.info("Development mode: allowing access without token")
-            return "development-access"
-        raise
+
+    optional_verify_token = verify_token
 
 # Dependency for protected endpoints
 require_auth = Depends(verify_token)
@@ -1,40 +1,63 @@
 import os
+from typing import Final
 from dotenv import load_dotenv
 
-# Load .env file only in development
-if os.getenv("ENVIRONMENT", "development") == "development":
-    load_dotenv()
+# Load .env file only in development, and only if one actually exists -
+# production containers skip the filesystem walk and parse entirely.
+# Resolve it next to this file so startup doesn't depend on the cwd.
+_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+if os.getenv("ENVIRONMENT", "development") == "development" and os.path.exists(_ENV_FILE):
+    load_dotenv(_ENV_FILE)
+
+# Environment flags resolved once at import. The derived booleans are
+# real module-level constants instead of class-body expressions that
+# only worked by accident of Python name resolution.
+ENVIRONMENT: Final[str] = os.getenv("ENVIRONMENT", "development")
+IS_PRODUCTION: Final[bool] = ENVIRONMENT == "production"
+DEBUG: Final[bool] = ENVIRONMENT == "development"
 
 class Settings:
     google_api_key: str = os.getenv("GOOGLE_API_KEY", "")
-    environment: str = os.getenv("ENVIRONMENT", "development")
+    environment: str = ENVIRONMENT
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     host: str = os.getenv("HOST", "0.0.0.0")
     # Railway provides PORT environment variable
     port: int = int(os.getenv("PORT", "8000"))
-    
+
     # Video generation settings
     max_video_duration: int = int(os.getenv("MAX_VIDEO_DURATION", "60"))
     max_concurrent_tasks: int = int(os.getenv("MAX_CONCURRENT_TASKS", "10"))
-    
+    worker_count: int = int(os.getenv("VEO3_WORKER_COUNT", "4"))
+    job_queue_size: int = int(os.getenv("JOB_QUEUE_SIZE", "1000"))
+
+    # Task storage settings - Railway provides REDIS_URL when a Redis
+    # service is attached; empty means in-memory storage
+    redis_url: str = os.getenv("REDIS_URL", "")
+    max_tracked_tasks: int = int(os.getenv("MAX_TRACKED_TASKS", "10000"))
+    task_retention_seconds: int = int(os.getenv("TASK_RETENTION_SECONDS", "86400"))
+
     # API settings
     api_title: str = "Veo3 Video Generation API"
     api_description: str = "Generate videos from text prompts using Google Gemini Veo3"
     api_version: str = "1.0.0"
-    
+
     # Authentication settings
     api_key: str = os.getenv("API_KEY", "")
     require_auth: bool = os.getenv("REQUIRE_AUTH", "true").lower() == "true"
-    
+
     # AWS S3 / DigitalOcean Spaces settings
     aws_access_key_id: str = os.getenv("AWS_ACCESS_KEY_ID", "")
     aws_secret_access_key: str = os.getenv("AWS_SECRET_ACCESS_KEY", "")
     aws_storage_bucket_name: str = os.getenv("AWS_STORAGE_BUCKET_NAME", "")
     aws_s3_region_name: str = os.getenv("AWS_S3_REGION_NAME", "us-east-1")
     aws_s3_endpoint_url: str = os.getenv("AWS_S3_ENDPOINT_URL", "")
-    
+    # Multipart upload tuning - bump concurrency/chunk size to match the
+    # link bandwidth of the deployment
+    s3_upload_concurrency: int = int(os.getenv("S3_UPLOAD_CONCURRENCY", "16"))
+    s3_multipart_chunksize_mb: int = int(os.getenv("S3_MULTIPART_CHUNKSIZE_MB", "16"))
+
     # Railway specific settings
-    is_production: bool = environment == "production"
-    debug: bool = environment == "development"
+    is_production: bool = IS_PRODUCTION
+    debug: bool = DEBUG
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
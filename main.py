@@ -1,31 +1,49 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Header, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer
 import uvicorn
+import asyncio
+import orjson
 from contextlib import asynccontextmanager
 import logging
+import os
+from typing import Optional
 
 from models import (
-    VideoGenerationRequest, 
-    VideoGenerationResponse, 
-    TaskStatusResponse, 
-    ErrorResponse
+    VideoGenerationRequest,
+    VideoGenerationResponse,
+    TaskStatusResponse,
+    TaskStatusResponseAdapter
 )
-from video_service import video_service
+from video_service import get_video_service
 from config import settings
 from auth import require_auth, optional_auth, auth_service
 
+# Resolve settings-derived values once at import time so request handlers
+# read module-level constants instead of repeating the lookups per request
+LOG_LEVEL_STR = settings.log_level.lower()
+LOG_LEVEL_INT = getattr(logging, settings.log_level.upper(), logging.INFO)
+ENVIRONMENT = settings.environment
+AUTH_REQUIRED = settings.require_auth
+
+# Task states that will never transition again
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
 # Configure logging
-logging.basicConfig(level=getattr(logging, settings.log_level))
+logging.basicConfig(level=LOG_LEVEL_INT)
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     logger.info("Starting Veo3 Video Generation API")
+    # Build the service and its worker pool here, where the event loop
+    # is guaranteed to be running
+    get_video_service()._ensure_workers()
     yield
     logger.info("Shutting down Veo3 Video Generation API")
+    await get_video_service().shutdown()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -34,19 +52,23 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Add security scheme to OpenAPI
 security = HTTPBearer()
 
-# Add CORS middleware
+# Add CORS middleware with an explicit allow-list so starlette builds its
+# lookup sets once at init instead of expanding wildcards per preflight;
+# max_age lets browsers cache the preflight result for a day
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
 @app.get("/", tags=["Health"])
@@ -65,8 +87,8 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "veo3-video-api",
-        "environment": settings.environment,
-        "auth_required": settings.require_auth
+        "environment": ENVIRONMENT,
+        "auth_required": AUTH_REQUIRED
     }
 
 @app.post("/auth/generate-key", tags=["Authentication"])
@@ -139,7 +161,7 @@ async def generate_video(request: VideoGenerationRequest, token: str = require_a
             )
         
         # Generate video
-        response = await video_service.generate_video(request)
+        response = await get_video_service().generate_video(request)
         
         logger.info(f"Video generation started with task ID: {response.task_id}")
         return response
@@ -147,18 +169,22 @@ async def generate_video(request: VideoGenerationRequest, token: str = require_a
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
+    except asyncio.QueueFull:
+        logger.warning("Video generation queue is full, rejecting request")
+        raise HTTPException(status_code=429, detail="Too many queued tasks - try again later")
     except Exception as e:
         logger.error(f"Video generation error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.get("/status/{task_id}", response_model=TaskStatusResponse, tags=["Video Generation"])
-async def get_task_status(task_id: str, token: str = require_auth):
+async def get_task_status(task_id: str, token: str = require_auth,
+                          if_none_match: Optional[str] = Header(default=None)):
     """
     Get the status of a video generation task.
-    
+
     Use this endpoint to check the progress and status of a video generation
     task using the task ID returned from the /generate endpoint.
-    
+
     Possible statuses:
     - **processing**: Video generation is in progress
     - **analyzing_prompt**: Analyzing the input prompt
@@ -168,16 +194,37 @@ async def get_task_status(task_id: str, token: str = require_auth):
     - **failed**: Video generation failed
     """
     try:
-        task_status = video_service.get_task_status(task_id)
-        
+        task_status = await get_video_service().get_task_status(task_id)
+
         if not task_status:
             raise HTTPException(
                 status_code=404,
                 detail=f"Task {task_id} not found"
             )
-        
-        return task_status
-        
+
+        # Terminal task state never changes, so let CDN/browser caches
+        # absorb repeat polls; in-progress responses get a weak ETag so
+        # unchanged polls collapse to a 304. video_url can appear while
+        # status/progress stand still (it is published before the upload
+        # finishes), so its presence is part of the ETag too.
+        etag = (f'W/"{task_status.status}-{task_status.progress}'
+                f'-{1 if task_status.video_url else 0}"')
+        if task_status.status in _TERMINAL_STATUSES:
+            cache_control = "public, max-age=31536000, immutable"
+        else:
+            cache_control = "no-cache"
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
+
+        # Serialize through the prebuilt adapter, skipping FastAPI's
+        # per-request response-model coercion on this polling-heavy path
+        return ORJSONResponse(
+            content=TaskStatusResponseAdapter.dump_python(task_status, mode="json"),
+            headers=headers
+        )
+
     except HTTPException:
         raise
     except Exception as e:
@@ -185,23 +232,82 @@ async def get_task_status(task_id: str, token: str = require_auth):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.get("/tasks", tags=["Video Generation"])
-async def list_tasks(token: str = require_auth):
+async def list_tasks(limit: int = Query(100, ge=1, le=1000),
+                     offset: int = Query(0, ge=0),
+                     token: str = require_auth):
     """
-    List all video generation tasks.
-    
-    Returns a list of all video generation tasks with their current status.
-    Useful for monitoring and debugging purposes.
+    List video generation tasks.
+
+    Returns a page of video generation tasks with their current status,
+    bounded by **limit**/**offset** so large task sets don't produce
+    unbounded responses. Useful for monitoring and debugging purposes.
     """
     try:
-        tasks = video_service.list_tasks()
+        tasks = await get_video_service().list_tasks(limit=limit, offset=offset)
         return {
             "tasks": tasks,
-            "total": len(tasks)
+            "total": len(tasks),
+            "limit": limit,
+            "offset": offset
         }
     except Exception as e:
         logger.error(f"Error listing tasks: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@app.get("/tasks/{task_id}/stream", tags=["Video Generation"])
+async def stream_task_events(task_id: str, token: str = require_auth):
+    """
+    Stream task progress updates as server-sent events.
+
+    Each status/progress transition is pushed over Redis Pub/Sub, so
+    clients get sub-second updates without polling /status. Requires
+    Redis-backed task storage (REDIS_URL).
+    """
+    video_service = get_video_service()
+
+    if video_service.redis is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Event streaming requires Redis task storage"
+        )
+
+    task_status = await video_service.get_task_status(task_id)
+    if not task_status:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Task {task_id} not found"
+        )
+
+    channel = video_service._task_events_channel(task_id)
+
+    async def event_stream():
+        pubsub = video_service.redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            # Emit the current state up front: subscribers to an
+            # already-finished task get their answer and the stream
+            # closes instead of waiting on a channel that will never
+            # publish again
+            snapshot = orjson.dumps({
+                "status": task_status.status,
+                "progress": task_status.progress
+            }).decode()
+            yield f"data: {snapshot}\n\n"
+            if task_status.status in _TERMINAL_STATUSES:
+                return
+
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield f"data: {message['data']}\n\n"
+                    event = orjson.loads(message["data"])
+                    if event.get("status") in _TERMINAL_STATUSES:
+                        return
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.delete("/tasks/{task_id}", tags=["Video Generation"])
 async def cancel_task(task_id: str, token: str = require_auth):
     """
@@ -211,24 +317,24 @@ async def cancel_task(task_id: str, token: str = require_auth):
     completed cannot be cancelled.
     """
     try:
-        task_status = video_service.get_task_status(task_id)
-        
+        video_service = get_video_service()
+        task_status = await video_service.get_task_status(task_id)
+
         if not task_status:
             raise HTTPException(
                 status_code=404,
                 detail=f"Task {task_id} not found"
             )
-        
-        if task_status.status in ["completed", "failed"]:
+
+        if task_status.status in _TERMINAL_STATUSES:
             raise HTTPException(
                 status_code=400,
                 detail=f"Cannot cancel task with status: {task_status.status}"
             )
-        
+
         # Update task status to cancelled
-        if task_id in video_service.tasks:
-            video_service.tasks[task_id]["status"] = "cancelled"
-        
+        await video_service.cancel_task(task_id)
+
         return {"message": f"Task {task_id} cancelled successfully"}
         
     except HTTPException:
@@ -238,25 +344,29 @@ async def cancel_task(task_id: str, token: str = require_auth):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 # Error handlers
+# Error payloads mirror the ErrorResponse schema; built as plain dicts so
+# the error path skips model validation and serialization overhead
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
-        content=ErrorResponse(
-            error="ValidationError",
-            message=str(exc)
-        ).dict()
+        content={
+            "error": "ValidationError",
+            "message": str(exc),
+            "details": None
+        }
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
-        content=ErrorResponse(
-            error="InternalServerError",
-            message="An unexpected error occurred"
-        ).dict()
+        content={
+            "error": "InternalServerError",
+            "message": "An unexpected error occurred",
+            "details": None
+        }
     )
 
 # N8N webhook endpoint for easier integration
@@ -275,13 +385,20 @@ async def webhook_get_status(task_id: str, token: str = require_auth):
     """
     Webhook endpoint to get task status for n8n integration.
     """
-    return await get_task_status(task_id, token)
+    # Explicit None: calling the handler directly would otherwise bind
+    # the Header param object to if_none_match
+    return await get_task_status(task_id, token, if_none_match=None)
 
 if __name__ == "__main__":
+    # uvloop + httptools (both shipped by uvicorn[standard]) replace the
+    # stdlib event loop and HTTP parser with C implementations
     uvicorn.run(
         "main:app",
         host=settings.host,
         port=settings.port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=LOG_LEVEL_STR
     )
\ No newline at end of file
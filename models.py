@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
 from enum import Enum
 
 class VideoResolution(str, Enum):
@@ -29,16 +29,23 @@ class VideoFormat(str, Enum):
     AVI = "avi"
 
 class VideoGenerationRequest(BaseModel):
-    prompt: str = Field(..., description="Text prompt to generate video from", min_length=1, max_length=2000)
+    # Literal unions instead of the Enum classes above: pydantic-core
+    # matches them against a fixed set in Rust without allocating enum
+    # instances per request. The Enum classes stay for other consumers.
+    model_config = ConfigDict(extra="forbid", validate_default=False, frozen=True)
+
+    prompt: Annotated[str, StringConstraints(min_length=1, max_length=2000)] = Field(..., description="Text prompt to generate video from")
     duration: Optional[int] = Field(default=5, description="Video duration in seconds", ge=1, le=60)
-    resolution: Optional[VideoResolution] = Field(default=VideoResolution.HD, description="Video resolution")
-    quality: Optional[VideoQuality] = Field(default=VideoQuality.MEDIUM, description="Video quality")
-    aspect_ratio: Optional[AspectRatio] = Field(default=AspectRatio.LANDSCAPE, description="Video aspect ratio")
-    format: Optional[VideoFormat] = Field(default=VideoFormat.MP4, description="Video output format")
+    resolution: Optional[Literal["720p", "1080p", "4k", "540p"]] = Field(default="720p", description="Video resolution")
+    quality: Optional[Literal["low", "medium", "high", "ultra"]] = Field(default="medium", description="Video quality")
+    aspect_ratio: Optional[Literal["16:9", "9:16", "1:1", "21:9", "4:3", "32:9"]] = Field(default="16:9", description="Video aspect ratio")
+    format: Optional[Literal["mp4", "webm", "mov", "avi"]] = Field(default="mp4", description="Video output format")
     fps: Optional[int] = Field(default=30, description="Frames per second", ge=24, le=60)
     style: Optional[str] = Field(default=None, description="Video style/aesthetic")
 
 class VideoGenerationResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_default=False)
+
     task_id: str = Field(..., description="Unique task identifier")
     status: str = Field(..., description="Generation status")
     message: str = Field(..., description="Status message")
@@ -48,6 +55,8 @@ class VideoGenerationResponse(BaseModel):
     created_at: str = Field(..., description="Creation timestamp")
 
 class TaskStatusResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_default=False)
+
     task_id: str = Field(..., description="Task identifier")
     status: str = Field(..., description="Current status")
     progress: Optional[int] = Field(default=None, description="Progress percentage")
@@ -57,6 +66,14 @@ class TaskStatusResponse(BaseModel):
     completed_at: Optional[str] = Field(default=None, description="Completion timestamp")
 
 class ErrorResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_default=False)
+
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
-    details: Optional[str] = Field(default=None, description="Additional error details")
\ No newline at end of file
+    details: Optional[str] = Field(default=None, description="Additional error details")
+
+# Prebuilt adapters with the pydantic-core schema resolved once at import.
+# Hot endpoints can dump through these directly instead of going through
+# FastAPI's per-request response-model coercion pipeline.
+VideoGenerationResponseAdapter = TypeAdapter(VideoGenerationResponse)
+TaskStatusResponseAdapter = TypeAdapter(TaskStatusResponse)
\ No newline at end of file
@@ -1,6 +1,8 @@
-import boto3
-import os
-import uuid
+import asyncio
+import functools
+import io
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from config import settings
 import logging
@@ -8,6 +10,12 @@ import logging
 logger = logging.getLogger(__name__)
 
 class S3VideoUploader:
+    # Shared upload arguments - allocated once instead of per call
+    _UPLOAD_EXTRA_ARGS = {
+        'ACL': 'public-read',
+        'ContentType': 'video/mp4'
+    }
+
     def __init__(self):
         """Initialize S3 client for DigitalOcean Spaces"""
         if not all([
@@ -17,63 +25,159 @@ class S3VideoUploader:
             settings.aws_s3_endpoint_url
         ]):
             raise ValueError("AWS S3 credentials not properly configured")
-        
-        self.s3_client = boto3.client(
-            's3',
-            region_name=settings.aws_s3_region_name,
-            endpoint_url=settings.aws_s3_endpoint_url,
-            aws_access_key_id=settings.aws_access_key_id,
-            aws_secret_access_key=settings.aws_secret_access_key
-        )
-        
+
+        self._client_kwargs = {
+            'region_name': settings.aws_s3_region_name,
+            'endpoint_url': settings.aws_s3_endpoint_url,
+            'aws_access_key_id': settings.aws_access_key_id,
+            'aws_secret_access_key': settings.aws_secret_access_key
+        }
+
         self.bucket_name = settings.aws_storage_bucket_name
-        
-    def upload_video(self, local_file_path: str, filename: Optional[str] = None) -> str:
+        # Precompute the public URL prefix once instead of rebuilding it per call
+        self._url_prefix = f"{settings.aws_s3_endpoint_url}/{self.bucket_name}/"
+
+        # Executor for offloading the remaining sync boto3 calls when
+        # they need to run from async code
+        self._executor = ThreadPoolExecutor(max_workers=settings.max_concurrent_tasks)
+
+    # boto3/aioboto3 imports are deferred to first use: boto3 alone costs
+    # hundreds of milliseconds of import + service-model loading, which
+    # would otherwise land on every worker cold start.
+
+    @functools.cached_property
+    def s3_client(self):
+        """Sync boto3 client, created on first use (kept for maintenance operations)"""
+        import boto3
+        return boto3.client('s3', config=self._boto_config, **self._client_kwargs)
+
+    @functools.cached_property
+    def _session(self):
+        """Async aioboto3 session for uploads, created on first use"""
+        import aioboto3
+        return aioboto3.Session()
+
+    @functools.cached_property
+    def _boto_config(self):
+        """Shared client config; botocore's default pool of 10 connections
+        would throttle concurrent multipart part uploads"""
+        from botocore.config import Config
+        return Config(max_pool_connections=50)
+
+    @functools.cached_property
+    def _transfer_config(self):
+        """Shared transfer config reused across uploads.
+
+        Concurrent multipart parts parallelize a single video's upload
+        across TCP streams; chunk size and concurrency are settings so
+        they can be tuned to the deployment's bandwidth.
+        """
+        from boto3.s3.transfer import TransferConfig
+        return TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=settings.s3_multipart_chunksize_mb * 1024 * 1024,
+            max_concurrency=settings.s3_upload_concurrency,
+            use_threads=True
+        )
+
+    @staticmethod
+    def _video_key(filename: Optional[str]) -> str:
+        """Resolve the bucket key for a video, generating a name if needed.
+
+        token_hex gives the same 16 random bytes as uuid4 without the
+        UUID object construction.
+        """
+        if not filename:
+            return f"videos/{secrets.token_hex(16)}.mp4"
+        return f"videos/{filename}"
+
+    def public_url_for(self, filename: str) -> str:
+        """Public URL a video will have once uploaded under this filename.
+
+        The URL is derivable from the key alone, so callers can publish
+        it before the upload finishes.
+        """
+        return self._url_prefix + self._video_key(filename)
+
+    async def upload_video_bytes(self, data: bytes, filename: Optional[str] = None) -> str:
+        """
+        Upload an in-memory video payload to S3/DigitalOcean Spaces.
+
+        Streams the bytes straight into a multipart upload, skipping the
+        temp-file write-then-read round trip through local disk.
+
+        Args:
+            data: Complete video payload
+            filename: Optional custom filename (if None, generates one)
+
+        Returns:
+            Public URL to the uploaded video
+        """
+        try:
+            key = self._video_key(filename)
+
+            async with self._session.client('s3', config=self._boto_config, **self._client_kwargs) as s3:
+                await s3.upload_fileobj(
+                    io.BytesIO(data),
+                    self.bucket_name,
+                    key,
+                    ExtraArgs=self._UPLOAD_EXTRA_ARGS,
+                    Config=self._transfer_config
+                )
+
+            public_url = self._url_prefix + key
+            logger.info(f"Video uploaded successfully: {public_url}")
+            return public_url
+
+        except Exception as e:
+            logger.error(f"Failed to upload video to S3: {str(e)}")
+            raise Exception(f"S3 upload failed: {str(e)}")
+
+    async def upload_video(self, local_file_path: str, filename: Optional[str] = None) -> str:
         """
         Upload video to S3/DigitalOcean Spaces and return public URL
-        
+
+        Runs on the async aioboto3 client so uploads don't block the
+        FastAPI event loop while the bytes are pushed to storage.
+
         Args:
             local_file_path: Path to the local video file
             filename: Optional custom filename (if None, generates UUID)
-            
+
         Returns:
             Public URL to the uploaded video
         """
         try:
-            # Generate filename if not provided
-            if not filename:
-                filename = f"videos/{uuid.uuid4()}.mp4"
-            else:
-                filename = f"videos/{filename}"
-            
+            key = self._video_key(filename)
+
             # Upload file to S3 with public-read ACL
-            self.s3_client.upload_file(
-                local_file_path,
-                self.bucket_name,
-                filename,
-                ExtraArgs={
-                    'ACL': 'public-read',
-                    'ContentType': 'video/mp4'
-                }
-            )
-            
+            async with self._session.client('s3', config=self._boto_config, **self._client_kwargs) as s3:
+                with open(local_file_path, 'rb') as video_file:
+                    await s3.upload_fileobj(
+                        video_file,
+                        self.bucket_name,
+                        key,
+                        ExtraArgs=self._UPLOAD_EXTRA_ARGS,
+                        Config=self._transfer_config
+                    )
+
             # Generate public URL
-            public_url = f"{settings.aws_s3_endpoint_url}/{self.bucket_name}/{filename}"
-            
+            public_url = self._url_prefix + key
+
             logger.info(f"Video uploaded successfully: {public_url}")
             return public_url
-            
+
         except Exception as e:
             logger.error(f"Failed to upload video to S3: {str(e)}")
             raise Exception(f"S3 upload failed: {str(e)}")
-    
+
     def delete_video(self, filename: str) -> bool:
         """
         Delete video from S3/DigitalOcean Spaces
-        
+
         Args:
             filename: Name of the file to delete (without videos/ prefix)
-            
+
         Returns:
             True if successful, False otherwise
         """
@@ -86,5 +190,15 @@ class S3VideoUploader:
             logger.error(f"Failed to delete video from S3: {str(e)}")
             return False
 
-# Global uploader instance
-s3_uploader = S3VideoUploader()
\ No newline at end of file
+    async def delete_video_async(self, filename: str) -> bool:
+        """
+        Async wrapper around delete_video that runs the blocking boto3
+        call in the uploader's thread pool instead of the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.delete_video, filename)
+
+@functools.lru_cache()
+def get_uploader() -> S3VideoUploader:
+    """Create the shared uploader on first use instead of at import time"""
+    return S3VideoUploader()
@@ -1,33 +1,207 @@
 import asyncio
+import functools
+import orjson
+import random
 import uuid
-from datetime import datetime
-from typing import Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
 import time
+from typing import Dict, Optional
+
+try:
+    import redis.asyncio as redis_async
+except ImportError:  # Redis is optional - fall back to in-memory storage
+    redis_async = None
 from google import genai
 from google.genai import types
 from config import settings
 from models import VideoGenerationRequest, VideoGenerationResponse, TaskStatusResponse
 import logging
 import tempfile
-import os
-from s3_uploader import s3_uploader
+from s3_uploader import get_uploader
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Veo3 model and static generation parameters, hoisted out of the call path
+_VEO3_MODEL = "veo-3.0-fast-generate-001"
+_VEO3_PERSON_GENERATION = "allow_all"  # Only supported value for text-to-video
+
+# Aspect ratios the Veo3 API accepts directly
+_VEO3_ASPECT_RATIOS = frozenset({"16:9", "9:16"})
+
+# Redis key prefix for task hashes
+_TASK_KEY_PREFIX = "video:task:"
+
+# Sorted set indexing task ids by creation time, used for stable
+# pagination without scanning the keyspace
+_TASK_INDEX_KEY = "video:tasks:by_created"
+
+
+# Prompts longer than this are enhanced in the CPU pool instead of on
+# the event loop, so heavy string formatting can't starve I/O coroutines
+_CPU_OFFLOAD_PROMPT_CHARS = 500
+
+
+def _utcnow_iso() -> str:
+    """Timezone-aware ISO timestamp, comparable across workers/regions."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Static prompt-building tables, hoisted so _enhance_prompt doesn't
+# rebuild them on every request
+_ORIENTATION_HINTS = {
+    "16:9": "landscape orientation, horizontal format, wide-screen",
+    "9:16": "portrait orientation, vertical format, mobile-friendly",
+    "1:1": "square format, social media optimized",
+    "21:9": "cinematic widescreen, ultra-wide format",
+    "4:3": "classic format, traditional aspect ratio",
+    "32:9": "ultra-wide panoramic format"
+}
+
+_OPTIMIZATION_NOTES = {
+    "9:16": "\n\nOptimization Notes: Optimize for vertical mobile viewing, ensure key elements are centered vertically, use larger text and clear visuals suitable for smartphone screens.",
+    "1:1": "\n\nOptimization Notes: Optimize for square social media format, ensure content fits well within square boundaries, center important elements.",
+    "21:9": "\n\nOptimization Notes: Create cinematic widescreen content, utilize the wide format for panoramic shots or dramatic compositions."
+}
+
+_PROMPT_TRAILER = "\n\nGenerate a high-quality, professional video that matches the prompt description with smooth motion, proper lighting, and composition optimized for the specified aspect ratio."
+
+# Static skeleton of the enhanced prompt, parsed once at import; the
+# builder fills the varying fields in a single format_map call
+_PROMPT_TEMPLATE = """Create a {duration}-second video with the following specifications:
+
+Content: {prompt}
+
+Technical Requirements:
+- Resolution: {resolution}
+- Quality: {quality}
+- Aspect Ratio: {aspect_ratio} ({orientation_hint})
+- Duration: {duration} seconds
+- Frame Rate: {fps} fps
+- Format: {fmt}{style_line}{notes_line}{trailer}"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_enhanced_prompt(prompt: str, duration: Optional[int], resolution: Optional[str],
+                           quality: Optional[str], aspect_ratio: Optional[str],
+                           fps: Optional[int], fmt: Optional[str], style: Optional[str]) -> str:
+    """
+    Build the enhanced Veo3 prompt from scalar request fields.
+
+    Cached so identical submissions (retries, batch jobs) reuse the
+    already-built string instead of re-formatting it; the single
+    format_map fill produces one final string with no intermediates.
+    """
+    aspect_ratio_value = aspect_ratio or "16:9"
+    return _PROMPT_TEMPLATE.format_map({
+        "duration": duration,
+        "prompt": prompt,
+        "resolution": resolution or "HD",
+        "quality": quality or "medium",
+        "aspect_ratio": aspect_ratio_value,
+        "orientation_hint": _ORIENTATION_HINTS.get(aspect_ratio_value, "standard format"),
+        "fps": fps or 30,
+        "fmt": fmt or "mp4",
+        "style_line": f"\n- Style: {style}" if style else "",
+        "notes_line": _OPTIMIZATION_NOTES.get(aspect_ratio_value, ""),
+        "trailer": _PROMPT_TRAILER
+    })
+
+@dataclass(slots=True)
+class TaskRecord:
+    """In-memory record of a single video generation task.
+
+    Slots keep each record compact (no per-instance __dict__) and make
+    status lookups plain attribute reads instead of dict key chasing.
+    """
+    status: str
+    created_at: str
+    request: VideoGenerationRequest
+    progress: int = 0
+    video_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    error_message: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
 class VideoGenerationService:
+    # Operation polling: start fast to catch early completions, back off
+    # toward the cap for long renders, give up at the wall-clock deadline
+    _POLL_INITIAL_DELAY = 0.5
+    _POLL_BACKOFF_FACTOR = 1.5
+    _POLL_MAX_DELAY = 15.0
+    _POLL_DEADLINE_SECONDS = 600
+
     def __init__(self):
         """Initialize the video generation service with Google Gemini API."""
         if not settings.google_api_key:
             raise ValueError("GOOGLE_API_KEY environment variable is required")
         
-        # Initialize the new Google GenAI client
-        self.client = genai.Client(api_key=settings.google_api_key)
+        # Initialize the new Google GenAI client. One client per process:
+        # the SDK keeps a pooled HTTP session underneath, so the kickoff
+        # call, every status poll and the download reuse warm connections
+        # instead of re-doing the TLS handshake to Google per request.
+        self.client = genai.Client(
+            api_key=settings.google_api_key,
+            http_options=types.HttpOptions(timeout=60_000)
+        )
         
-        # In-memory task storage (use Redis/database in production)
-        self.tasks: Dict[str, Dict] = {}
+        # Task storage: Redis when configured (shared across workers and
+        # restart-safe), otherwise a bounded in-memory store for
+        # single-worker use (insertion-ordered for oldest-first eviction)
+        self.tasks: "OrderedDict[str, TaskRecord]" = OrderedDict()
+        self.redis = None
+        if settings.redis_url and redis_async is not None:
+            self.redis = redis_async.from_url(settings.redis_url, decode_responses=True)
+            logger.info("Using Redis task storage")
+
+        # Bounded job queue consumed by a fixed worker pool, so a burst of
+        # submissions can't spawn one polling coroutine per request.
+        # Workers start lazily on first submission (needs a running loop).
+        self.job_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.job_queue_size)
+        self._workers: list = []
+
+        # Small pool for compute-bound work (prompt enhancement), kept
+        # separate from the I/O-bound Veo3 polling coroutines
+        self.cpu_pool = ThreadPoolExecutor(max_workers=4)
+
+        # Bounded pool for the synchronous GenAI SDK calls. Routing them
+        # through one sized executor (instead of asyncio.to_thread's
+        # shared default pool) caps how many blocking SDK calls can be
+        # in flight at once and keeps them from starving other users of
+        # the default pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.max_concurrent_tasks,
+            thread_name_prefix="genai-sdk"
+        )
+
+        # Singleflight map: identical requests currently in flight share
+        # one Veo3 call instead of each burning quota
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+        # Last (status, progress) written per task, used to coalesce
+        # no-op transitions without a storage read
+        self._last_transition: Dict[str, tuple] = {}
+
+        # Operations awaiting completion, serviced by one shared poller
+        # coroutine instead of a polling loop per task
+        self._pending_ops: Dict[str, tuple] = {}
+        self._poll_task: Optional[asyncio.Task] = None
         
+    async def _run_blocking(self, func, /, *args, **kwargs):
+        """Run a blocking SDK call on the bounded SDK executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
     async def generate_video(self, request: VideoGenerationRequest) -> VideoGenerationResponse:
         """
         Generate a video from text prompt using Google Gemini Veo3 API.
@@ -38,22 +212,26 @@ class VideoGenerationService:
         Returns:
             VideoGenerationResponse with task details
         """
-        task_id = str(uuid.uuid4())
-        created_at = datetime.now().isoformat()
+        # .hex skips the hyphenated UUID formatter: 32 chars, one less
+        # allocation, smaller storage keys
+        task_id = uuid.uuid4().hex
+        created_at = _utcnow_iso()
         
         # Store initial task
-        self.tasks[task_id] = {
-            "status": "processing",
-            "progress": 0,
-            "created_at": created_at,
-            "request": request.dict(),
-            "video_url": None,
-            "error_message": None,
-            "completed_at": None
-        }
-        
-        # Start background video generation
-        asyncio.create_task(self._process_video_generation(task_id, request))
+        await self._create_task(task_id, created_at, request)
+
+        # Queue the job for the worker pool
+        self._ensure_workers()
+        try:
+            self.job_queue.put_nowait((task_id, request))
+        except asyncio.QueueFull:
+            await self._update_task(
+                task_id,
+                status="failed",
+                error_message="Task queue is full",
+                completed_at=_utcnow_iso()
+            )
+            raise
         
         return VideoGenerationResponse(
             task_id=task_id,
@@ -61,7 +239,172 @@ class VideoGenerationService:
             message="Video generation started",
             created_at=created_at
         )
-    
+
+    @staticmethod
+    def _log_crashed_task(task: asyncio.Task):
+        """Surface exceptions from background tasks instead of losing them."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task crashed: {task.exception()!r}")
+
+    def _ensure_workers(self):
+        """Start the worker pool (and in-memory GC) on first use."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(settings.worker_count)
+        ]
+        if self.redis is None:
+            # Redis handles retention via TTLs; the in-memory store needs
+            # its own sweeper
+            self._workers.append(asyncio.create_task(self._gc_loop()))
+        # Holding the handles (and logging crashes) keeps these tasks
+        # from being garbage-collected or failing silently
+        for worker in self._workers:
+            worker.add_done_callback(self._log_crashed_task)
+        logger.info(f"Started {settings.worker_count} video generation workers")
+
+    async def shutdown(self):
+        """Cancel background tasks and release executors on app shutdown."""
+        background = list(self._workers)
+        if self._poll_task is not None:
+            background.append(self._poll_task)
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        self._workers = []
+        self._poll_task = None
+        self.cpu_pool.shutdown(wait=False)
+        self._executor.shutdown(wait=False)
+
+    async def _gc_loop(self):
+        """Periodically drop finished tasks older than the retention window."""
+        while True:
+            await asyncio.sleep(60)
+            cutoff = datetime.now(timezone.utc).timestamp() - settings.task_retention_seconds
+            expired = [
+                task_id for task_id, task in self.tasks.items()
+                if task.status in _TERMINAL_STATUSES and task.completed_at
+                and datetime.fromisoformat(task.completed_at).timestamp() < cutoff
+            ]
+            for task_id in expired:
+                self.tasks.pop(task_id, None)
+                self._last_transition.pop(task_id, None)
+            if expired:
+                logger.info(f"Garbage-collected {len(expired)} finished tasks")
+
+    async def _worker(self):
+        """Consume queued jobs, bounding concurrent generations to the pool size."""
+        while True:
+            task_id, request = await self.job_queue.get()
+            try:
+                await self._process_video_generation(task_id, request)
+            except Exception as e:
+                logger.error(f"Worker error processing task {task_id}: {str(e)}")
+            finally:
+                self.job_queue.task_done()
+
+    @staticmethod
+    def _task_key(task_id: str) -> str:
+        return f"{_TASK_KEY_PREFIX}{task_id}"
+
+    @staticmethod
+    def _task_events_channel(task_id: str) -> str:
+        return f"{_TASK_KEY_PREFIX}{task_id}:events"
+
+    async def _create_task(self, task_id: str, created_at: str, request: VideoGenerationRequest):
+        """Store the initial record for a new task.
+
+        The request snapshot is deliberately not serialized here - that
+        happens in the worker (_store_request_snapshot), off the
+        submission handler's critical path. The model is frozen, so
+        holding a reference is safe.
+        """
+        if self.redis is not None:
+            key = self._task_key(task_id)
+            await self.redis.hset(key, mapping={
+                "status": "processing",
+                "progress": 0,
+                "created_at": created_at
+            })
+            # TTL from birth: even a task orphaned mid-flight by a
+            # worker crash ages out instead of lingering forever
+            await self.redis.expire(key, settings.task_retention_seconds)
+            await self.redis.zadd(_TASK_INDEX_KEY, {task_id: time.time()})
+        else:
+            self.tasks[task_id] = TaskRecord(
+                status="processing",
+                created_at=created_at,
+                request=request
+            )
+            # Cap the store: evict the oldest tasks beyond the limit so
+            # a long-running process can't grow without bound
+            while len(self.tasks) > settings.max_tracked_tasks:
+                evicted_id, _ = self.tasks.popitem(last=False)
+                self._last_transition.pop(evicted_id, None)
+
+    async def _store_request_snapshot(self, task_id: str, request: VideoGenerationRequest):
+        """Serialize the request into Redis task storage, off the handler path.
+
+        The in-memory store already holds the frozen model by reference,
+        so only Redis mode needs a serialized copy.
+        """
+        if self.redis is not None:
+            await self.redis.hset(
+                self._task_key(task_id),
+                "request",
+                orjson.dumps(
+                    request.model_dump(exclude_defaults=True, exclude_none=True)
+                ).decode()
+            )
+
+    async def _update_task(self, task_id: str, **fields):
+        """
+        Apply a state transition to a task.
+
+        Writes all changed fields in one operation. Each Redis write
+        refreshes the retention TTL set at creation, so every task ages
+        out instead of accumulating forever.
+        """
+        # Coalesce writes: a transition that repeats the last written
+        # status/progress and carries nothing else is a no-op
+        if set(fields) <= {"status", "progress"}:
+            transition = (fields.get("status"), fields.get("progress"))
+            if self._last_transition.get(task_id) == transition:
+                return
+            self._last_transition[task_id] = transition
+        elif fields.get("status") in _TERMINAL_STATUSES:
+            self._last_transition.pop(task_id, None)
+
+        if self.redis is not None:
+            key = self._task_key(task_id)
+            mapping = {k: v for k, v in fields.items() if v is not None}
+            # HSET can't store None, so fields explicitly passed as None
+            # are cleared with HDEL instead of being silently dropped
+            cleared = [k for k, v in fields.items() if v is None]
+            if mapping:
+                await self.redis.hset(key, mapping=mapping)
+            if cleared:
+                await self.redis.hdel(key, *cleared)
+            await self.redis.expire(key, settings.task_retention_seconds)
+            # Push the transition to subscribers so clients streaming
+            # events don't have to poll the status endpoint
+            if "status" in fields or "progress" in fields:
+                await self.redis.publish(
+                    self._task_events_channel(task_id),
+                    orjson.dumps({
+                        "status": fields.get("status"),
+                        "progress": fields.get("progress")
+                    }).decode()
+                )
+        else:
+            task = self.tasks.get(task_id)
+            if task is None:
+                return
+            for field_name, value in fields.items():
+                setattr(task, field_name, value)
+
+
     async def _process_video_generation(self, task_id: str, request: VideoGenerationRequest):
         """
         Background task to process video generation.
@@ -70,48 +413,112 @@ class VideoGenerationService:
             task_id: Unique task identifier
             request: Video generation request
         """
+        # Monotonic start for duration logging - wall-clock timestamps
+        # can jump and aren't safe for elapsed-time math
+        started = time.monotonic()
         try:
+            # Persist the request snapshot here, in the worker, instead of
+            # on the submission handler's critical path
+            await self._store_request_snapshot(task_id, request)
+
             # Update progress
-            self.tasks[task_id]["progress"] = 10
-            self.tasks[task_id]["status"] = "analyzing_prompt"
-            
+            await self._update_task(task_id, progress=10, status="analyzing_prompt")
+
             logger.info(f"Starting video generation for task {task_id}")
-            
-            # Prepare the enhanced prompt for Veo3
-            enhanced_prompt = self._enhance_prompt(request)
-            
+
+            # Prepare the enhanced prompt for Veo3; offload large prompts
+            # to the CPU pool so formatting doesn't block the event loop
+            if len(request.prompt) > _CPU_OFFLOAD_PROMPT_CHARS:
+                enhanced_prompt = await asyncio.get_running_loop().run_in_executor(
+                    self.cpu_pool, self._enhance_prompt, request
+                )
+            else:
+                enhanced_prompt = self._enhance_prompt(request)
+
             # Update progress
-            self.tasks[task_id]["progress"] = 30
-            self.tasks[task_id]["status"] = "generating"
-            
-            # Generate video using Gemini Veo3
-            video_result = await self._call_veo3_api(enhanced_prompt, request)
-            
+            await self._update_task(task_id, progress=30, status="generating")
+
+            async def publish_video_url(url: str):
+                # The S3 URL is known before the upload finishes; publish
+                # it early so pollers see where the video will land. The
+                # task only flips to completed once the upload resolves.
+                await self._update_task(task_id, video_url=url)
+
+            # Generate video using Gemini Veo3, deduplicating identical
+            # in-flight requests
+            video_result = await self._generate_deduplicated(
+                enhanced_prompt, request, on_video_url=publish_video_url
+            )
+
             # Update progress
-            self.tasks[task_id]["progress"] = 80
-            self.tasks[task_id]["status"] = "finalizing"
-            
+            await self._update_task(task_id, progress=80, status="finalizing")
+
             # Process the result
             if video_result and "video_url" in video_result:
-                self.tasks[task_id].update({
-                    "status": "completed",
-                    "progress": 100,
-                    "video_url": video_result["video_url"],
-                    "thumbnail_url": video_result.get("thumbnail_url"),
-                    "completed_at": datetime.now().isoformat()
-                })
-                logger.info(f"Video generation completed for task {task_id}")
+                await self._update_task(
+                    task_id,
+                    status="completed",
+                    progress=100,
+                    video_url=video_result["video_url"],
+                    thumbnail_url=video_result.get("thumbnail_url"),
+                    completed_at=_utcnow_iso()
+                )
+                logger.info(
+                    f"Video generation completed for task {task_id} "
+                    f"in {time.monotonic() - started:.1f}s"
+                )
             else:
                 raise Exception("Failed to generate video - no result returned")
-                
+
         except Exception as e:
-            logger.error(f"Video generation failed for task {task_id}: {str(e)}")
-            self.tasks[task_id].update({
-                "status": "failed",
-                "error_message": str(e),
-                "completed_at": datetime.now().isoformat()
-            })
+            logger.error(
+                f"Video generation failed for task {task_id} "
+                f"after {time.monotonic() - started:.1f}s: {str(e)}"
+            )
+            await self._update_task(
+                task_id,
+                status="failed",
+                error_message=str(e),
+                # Drop any pre-published URL - on failure it points at an
+                # object that never finished uploading
+                video_url=None,
+                completed_at=_utcnow_iso()
+            )
     
+    async def _generate_deduplicated(self, prompt: str, request: VideoGenerationRequest,
+                                     on_video_url=None) -> Dict:
+        """
+        Collapse concurrent identical submissions into a single Veo3 call.
+
+        The first caller runs the API call; any later task with the same
+        request fields awaits the same future and shares the result.
+        """
+        # The enhanced prompt encodes every request field that shapes the
+        # output (including fps/format); aspect ratio and resolution also
+        # feed the API config directly, so key on all three - anything
+        # else collapses requests that would produce different videos
+        key = (prompt, request.aspect_ratio, request.resolution)
+
+        existing = self._inflight.get(key)
+        if existing is not None:
+            logger.info("Identical request already in flight - sharing its result")
+            return await asyncio.shield(existing)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._call_veo3_api(prompt, request, on_video_url=on_video_url)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else awaited
+            # this future, so the loop doesn't log a spurious warning
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
     def _enhance_prompt(self, request: VideoGenerationRequest) -> str:
         """
         Enhance the user prompt with technical specifications for Veo3.
@@ -122,123 +529,130 @@ class VideoGenerationService:
         Returns:
             Enhanced prompt string
         """
-        base_prompt = request.prompt
-        
-        # Determine video orientation based on aspect ratio
-        orientation_hints = {
-            "16:9": "landscape orientation, horizontal format, wide-screen",
-            "9:16": "portrait orientation, vertical format, mobile-friendly", 
-            "1:1": "square format, social media optimized",
-            "21:9": "cinematic widescreen, ultra-wide format",
-            "4:3": "classic format, traditional aspect ratio",
-            "32:9": "ultra-wide panoramic format"
-        }
-        
-        # Get aspect ratio value, handling both enum and string cases
-        if request.aspect_ratio and hasattr(request.aspect_ratio, 'value'):
-            aspect_ratio_value = request.aspect_ratio.value
-        elif request.aspect_ratio:
-            aspect_ratio_value = str(request.aspect_ratio) 
+        return _build_enhanced_prompt(
+            request.prompt,
+            request.duration,
+            request.resolution,
+            request.quality,
+            request.aspect_ratio,
+            request.fps,
+            request.format,
+            request.style
+        )
+    
+    def _ensure_poller(self):
+        """Start the shared operation poller if it isn't running."""
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_loop())
+            self._poll_task.add_done_callback(self._log_crashed_task)
+
+    async def _wait_for_operation(self, operation):
+        """Register an operation with the shared poller and await completion."""
+        if operation.done:
+            return operation
+
+        key = getattr(operation, 'name', None) or uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending_ops[key] = (operation, future)
+        self._ensure_poller()
+        try:
+            return await asyncio.wait_for(future, timeout=self._POLL_DEADLINE_SECONDS)
+        except asyncio.TimeoutError:
+            self._pending_ops.pop(key, None)
+            raise Exception("Video generation timed out after 10 minutes")
+
+    async def _refresh_operation(self, key: str):
+        """Poll one pending operation, resolving its future when done."""
+        entry = self._pending_ops.get(key)
+        if entry is None:
+            return
+        operation, future = entry
+        try:
+            operation = await self._run_blocking(self.client.operations.get, operation)
+        except Exception as e:
+            logger.warning(f"Error checking operation status: {e}")
+            return
+        if operation.done:
+            self._pending_ops.pop(key, None)
+            if not future.done():
+                future.set_result(operation)
         else:
-            aspect_ratio_value = "16:9"
-            
-        orientation_hint = orientation_hints.get(aspect_ratio_value, "standard format")
-        
-        # Add technical specifications
-        enhanced = f"""Create a {request.duration}-second video with the following specifications:
-        
-Content: {base_prompt}
+            self._pending_ops[key] = (operation, future)
 
-Technical Requirements:
-- Resolution: {request.resolution.value if request.resolution else 'HD'}
-- Quality: {request.quality.value if request.quality else 'medium'}
-- Aspect Ratio: {aspect_ratio_value} ({orientation_hint})
-- Duration: {request.duration} seconds
-- Frame Rate: {getattr(request, 'fps', 30)} fps
-- Format: {getattr(request.format, 'value', 'mp4') if hasattr(request, 'format') and request.format else 'mp4'}"""
-
-        if request.style:
-            enhanced += f"\n- Style: {request.style}"
-            
-        # Add format-specific optimization hints
-        if aspect_ratio_value == "9:16":
-            enhanced += "\n\nOptimization Notes: Optimize for vertical mobile viewing, ensure key elements are centered vertically, use larger text and clear visuals suitable for smartphone screens."
-        elif aspect_ratio_value == "1:1":
-            enhanced += "\n\nOptimization Notes: Optimize for square social media format, ensure content fits well within square boundaries, center important elements."
-        elif aspect_ratio_value == "21:9":
-            enhanced += "\n\nOptimization Notes: Create cinematic widescreen content, utilize the wide format for panoramic shots or dramatic compositions."
-            
-        enhanced += "\n\nGenerate a high-quality, professional video that matches the prompt description with smooth motion, proper lighting, and composition optimized for the specified aspect ratio."
+    async def _poll_loop(self):
+        """
+        Batch operation status checks for all in-flight generations.
 
-        return enhanced
-    
-    async def _call_veo3_api(self, prompt: str, request: VideoGenerationRequest) -> Dict:
+        One coroutine sweeps every pending operation per tick, so poll
+        traffic grows with the tick rate instead of with concurrency.
+        Ticks back off exponentially with jitter, like the old per-task
+        loop, and the loop exits once nothing is pending - the next
+        registration starts a fresh one at the fast initial interval.
+        """
+        delay = self._POLL_INITIAL_DELAY
+        while self._pending_ops:
+            await asyncio.sleep(delay + random.uniform(0, 0.5))
+            await asyncio.gather(
+                *[self._refresh_operation(key) for key in list(self._pending_ops)]
+            )
+            delay = min(delay * self._POLL_BACKOFF_FACTOR, self._POLL_MAX_DELAY)
+
+    async def _call_veo3_api(self, prompt: str, request: VideoGenerationRequest,
+                             on_video_url=None) -> Dict:
         """
         Call Google Gemini Veo3 API for video generation using the official SDK.
-        
+
         Args:
             prompt: Enhanced prompt for video generation
             request: Original request parameters
-            
+            on_video_url: Optional async callback invoked with the final
+                public URL as soon as it is known, before the upload runs
+
         Returns:
             Dictionary containing video generation results
         """
         try:
             logger.info(f"Starting Veo3 API call with prompt: {prompt[:100]}...")
             
-            # Prepare parameters for Veo3 API using SDK
-            # Get the actual string value from AspectRatio enum
-            if request.aspect_ratio and hasattr(request.aspect_ratio, 'value'):
-                aspect_ratio_value = request.aspect_ratio.value
-            elif request.aspect_ratio:
-                aspect_ratio_value = str(request.aspect_ratio)
-            else:
-                aspect_ratio_value = "16:9"
-            
+            # Request fields are validated Literal strings with defaults,
+            # so read them directly - no enum/hasattr branching needed
+            aspect_ratio_value = request.aspect_ratio or "16:9"
+
             # Ensure aspect ratio is in the correct format for API
-            if aspect_ratio_value not in ["16:9", "9:16"]:
+            if aspect_ratio_value not in _VEO3_ASPECT_RATIOS:
                 aspect_ratio_value = "16:9"  # Default to 16:9 if unsupported
             
             # Prepare resolution - ensure compatibility with aspect ratio
             resolution_value = "720p"  # Default
             if request.resolution:
-                if request.resolution.value == "1080p" and aspect_ratio_value == "16:9":
+                if request.resolution == "1080p" and aspect_ratio_value == "16:9":
                     resolution_value = "1080p"  # 1080p only supports 16:9
-                elif request.resolution.value in ["720p", "540p"]:
+                elif request.resolution in ("720p", "540p"):
                     resolution_value = "720p"  # Use 720p for all other cases
             
             logger.info(f"Using SDK approach with aspect ratio: {aspect_ratio_value}, resolution: {resolution_value}")
             
             # Use the official SDK approach with ONLY supported Veo3 parameters
             # According to official docs: only aspectRatio, resolution, personGeneration, negativePrompt, seed are supported
-            operation = self.client.models.generate_videos(
-                model="veo-3.0-fast-generate-001",
+            # The SDK call is synchronous HTTP, so run it on the bounded
+            # SDK executor to keep the event loop free for other requests
+            operation = await self._run_blocking(
+                self.client.models.generate_videos,
+                model=_VEO3_MODEL,
                 prompt=prompt,
                 config=types.GenerateVideosConfig(
                     aspect_ratio=aspect_ratio_value,
                     resolution=resolution_value,
-                    person_generation="allow_all"  # Only supported value for text-to-video
+                    person_generation=_VEO3_PERSON_GENERATION
                 )
             )
             
-            logger.info(f"Video generation operation started: {operation.name if hasattr(operation, 'name') else 'unknown'}")
-            
-            # Poll the operation status until the video is ready (async version)
-            max_attempts = 60  # 10 minutes max
-            attempts = 0
-            
-            while not operation.done and attempts < max_attempts:
-                logger.info(f"Waiting for video generation to complete... (attempt {attempts + 1}/{max_attempts})")
-                await asyncio.sleep(10)
-                try:
-                    operation = self.client.operations.get(operation)
-                except Exception as e:
-                    logger.warning(f"Error checking operation status: {e}")
-                attempts += 1
-            
-            if not operation.done:
-                raise Exception("Video generation timed out after 10 minutes")
+            logger.info(f"Video generation operation started: {getattr(operation, 'name', 'unknown')}")
             
+            # Hand the operation to the shared poller, which batches
+            # status checks across every in-flight generation
+            operation = await self._wait_for_operation(operation)
+
             logger.info("Video generation completed")
             
             # Check if response exists and has the expected structure
@@ -249,46 +663,48 @@ Technical Requirements:
                 raise Exception("No generated videos found in response")
             
             generated_video = operation.response.generated_videos[0]
-            
-            # Create a temporary directory for the video download
-            temp_dir = tempfile.mkdtemp()
-            video_filename = f"video_{uuid.uuid4()}.mp4"
-            temp_video_path = os.path.join(temp_dir, video_filename)
-            
+
+            video_filename = f"video_{uuid.uuid4().hex}.mp4"
+
+            # The public URL only depends on the key, so surface it now:
+            # pollers learn where the video will land while the download
+            # and upload are still in flight
+            if on_video_url is not None:
+                await on_video_url(get_uploader().public_url_for(video_filename))
+
             # Try to download the video file using SDK
             public_video_url = None
             try:
                 if hasattr(generated_video, 'video') and generated_video.video:
-                    self.client.files.download(file=generated_video.video)
-                    if hasattr(generated_video.video, 'save'):
-                        generated_video.video.save(temp_video_path)
+                    await self._run_blocking(self.client.files.download, file=generated_video.video)
+                    # Prefer streaming the raw bytes straight to S3: the
+                    # multipart upload reads from memory, skipping the
+                    # temp-file write-then-read through local disk. Fall
+                    # back to the SDK's blocking save() when the bytes
+                    # aren't exposed - save() needs a real path.
+                    video_bytes = getattr(generated_video.video, 'video_bytes', None)
+                    if video_bytes:
+                        public_video_url = await get_uploader().upload_video_bytes(
+                            video_bytes, video_filename
+                        )
+                    elif hasattr(generated_video.video, 'save'):
+                        # NamedTemporaryFile deletes itself on exit, even
+                        # when save or the upload raises - no manual
+                        # remove/rmdir bookkeeping or exists() races
+                        with tempfile.NamedTemporaryFile(suffix=".mp4") as tmp:
+                            await self._run_blocking(generated_video.video.save, tmp.name)
+                            public_video_url = await get_uploader().upload_video(
+                                tmp.name, video_filename
+                            )
                     else:
-                        # Alternative: save raw bytes if available
-                        video_bytes = getattr(generated_video.video, 'video_bytes', None)
-                        if video_bytes:
-                            with open(temp_video_path, 'wb') as f:
-                                f.write(video_bytes)
-                        else:
-                            raise Exception("No video bytes available")
-                    
-                    # Upload to S3 and get public URL
-                    public_video_url = s3_uploader.upload_video(temp_video_path, video_filename)
-                    
-                    # Clean up temporary file
-                    os.remove(temp_video_path)
-                    os.rmdir(temp_dir)
-                    
+                        raise Exception("No video bytes available")
+
                     logger.info(f"Video uploaded to S3: {public_video_url}")
-                    
+
                 else:
                     raise Exception("No video file found in generated video")
             except Exception as download_error:
                 logger.error(f"Download/upload error: {download_error}")
-                # Clean up temp files if they exist
-                if os.path.exists(temp_video_path):
-                    os.remove(temp_video_path)
-                if os.path.exists(temp_dir):
-                    os.rmdir(temp_dir)
                 raise Exception(f"Failed to process video: {download_error}")
             
             logger.info(f"Video processing completed: {public_video_url}")
@@ -308,46 +724,116 @@ Technical Requirements:
     
 
     
-    def get_task_status(self, task_id: str) -> Optional[TaskStatusResponse]:
+    async def get_task_status(self, task_id: str) -> Optional[TaskStatusResponse]:
         """
         Get the status of a video generation task.
-        
+
         Args:
             task_id: Task identifier
-            
+
         Returns:
             TaskStatusResponse or None if task not found
         """
-        if task_id not in self.tasks:
+        if self.redis is not None:
+            data = await self.redis.hgetall(self._task_key(task_id))
+            if not data:
+                return None
+            return self._status_from_hash(task_id, data)
+
+        task = self.tasks.get(task_id)
+        if task is None:
             return None
-            
-        task = self.tasks[task_id]
-        
-        return TaskStatusResponse(
+
+        return TaskStatusResponse.model_construct(
             task_id=task_id,
-            status=task["status"],
-            progress=task.get("progress"),
-            video_url=task.get("video_url"),
-            error_message=task.get("error_message"),
-            created_at=task["created_at"],
-            completed_at=task.get("completed_at")
+            status=task.status,
+            progress=task.progress,
+            video_url=task.video_url,
+            error_message=task.error_message,
+            created_at=task.created_at,
+            completed_at=task.completed_at
         )
-    
-    def list_tasks(self) -> Dict[str, TaskStatusResponse]:
+
+    @staticmethod
+    def _status_from_hash(task_id: str, data: Dict[str, str]) -> TaskStatusResponse:
+        """Build a TaskStatusResponse from a Redis task hash."""
+        return TaskStatusResponse.model_construct(
+            task_id=task_id,
+            status=data["status"],
+            progress=int(data["progress"]) if "progress" in data else None,
+            video_url=data.get("video_url"),
+            error_message=data.get("error_message"),
+            created_at=data.get("created_at", ""),
+            completed_at=data.get("completed_at")
+        )
+
+    async def list_tasks(self, limit: int = 100, offset: int = 0) -> Dict[str, TaskStatusResponse]:
         """
-        List all video generation tasks.
-        
+        List video generation tasks, bounded by a limit/offset window.
+
+        Args:
+            limit: Maximum number of tasks to return
+            offset: Number of tasks to skip from the start
+
         Returns:
             Dictionary of task IDs to TaskStatusResponse
         """
-        result = {}
-        for task_id in self.tasks.keys():
-            task_status = self.get_task_status(task_id)
-            if task_status:
-                result[task_id] = task_status
-        return result
-    
+        if self.redis is not None:
+            # Page through the creation-time index: O(page) work with a
+            # stable order, instead of a full keyspace SCAN whose
+            # ordering shifts between calls
+            task_ids = await self.redis.zrange(
+                _TASK_INDEX_KEY, offset, offset + limit - 1
+            )
+            if not task_ids:
+                return {}
+
+            # Fetch only the requested page of hashes in one pipelined
+            # round trip instead of one HGETALL per task
+            pipe = self.redis.pipeline()
+            for task_id in task_ids:
+                pipe.hgetall(self._task_key(task_id))
+            rows = await pipe.execute()
+
+            # Hashes age out via TTL; prune their leftover index entries
+            expired = [t for t, data in zip(task_ids, rows) if not data]
+            if expired:
+                await self.redis.zrem(_TASK_INDEX_KEY, *expired)
+
+            return {
+                task_id: self._status_from_hash(task_id, data)
+                for task_id, data in zip(task_ids, rows) if data
+            }
+
+        # Single islice pass over items(), building each response directly
+        # from the record instead of re-looking every task up by id
+        return {
+            task_id: TaskStatusResponse.model_construct(
+                task_id=task_id,
+                status=task.status,
+                progress=task.progress,
+                video_url=task.video_url,
+                error_message=task.error_message,
+                created_at=task.created_at,
+                completed_at=task.completed_at
+            )
+            for task_id, task in islice(self.tasks.items(), offset, offset + limit)
+        }
+
+    async def cancel_task(self, task_id: str):
+        """Mark a task as cancelled."""
+        await self._update_task(task_id, status="cancelled")
+
+
 
+# Lazily-created global service instance. Building it at import time
+# would demand a configured API key during test collection and create
+# the singleton outside any running event loop.
+_service: Optional[VideoGenerationService] = None
 
-# Global service instance
-video_service = VideoGenerationService()
\ No newline at end of file
+def get_video_service() -> VideoGenerationService:
+    """Return the shared service instance, creating it on first use."""
+    global _service
+    if _service is None:
+        _service = VideoGenerationService()
+    return _service
\ No newline at end of file